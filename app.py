@@ -4,6 +4,7 @@ from xrpl.models.requests import AccountLines
 import json
 import time
 from storage import load_data, save_data
+from holder_stats import load_holder_stats
 
 app = Flask(__name__)
 
@@ -37,7 +38,7 @@ def get_pft_balance(address):
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return render_template('index.html', balances_url='/api/balances', read_only=False)
 
 @app.route('/api/balances')
 def get_balances():
@@ -54,6 +55,15 @@ def get_balances():
     balances.sort(key=lambda x: x['balance'], reverse=True)
     return jsonify(balances)
 
+@app.route('/api/stats')
+def get_stats():
+    # Stats are recorded by update_rankings.py on each cron run; serve them without any RPC
+    history = load_holder_stats()['history']
+    return jsonify({
+        'latest': history[-1] if history else None,
+        'history': history
+    })
+
 @app.route('/api/nickname', methods=['POST'])
 def update_nickname():
     data = request.json
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+import gzip
+import hashlib
+import json
+import os
+import sys
+from jinja2 import Environment, FileSystemLoader
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from holder_stats import load_holder_stats
+from storage import load_data
+from update_rankings import REMBRANCER_ADDRESS, load_balance_history, load_previous_balances
+
+STATIC_DIR = 'public'
+TEMPLATES_DIR = 'templates'
+
+def build_leaderboard(tracked_addresses, previous_balances):
+    """Build the same payload as /api/balances from the last cron snapshot."""
+    snapshot = previous_balances.get('balances', {})
+    balances = []
+    for address, info in tracked_addresses.items():
+        balances.append({
+            'address': address,
+            'nickname': info.get('nickname', ''),
+            'balance': snapshot.get(address, 0)
+        })
+
+    # Sort by balance in descending order
+    balances.sort(key=lambda x: x['balance'], reverse=True)
+    return balances
+
+def build_rollup(balance_history):
+    """Roll holder balances up into one total per snapshot timestamp, excluding the Remembrancer."""
+    totals = {}
+    for address, entries in balance_history.items():
+        if address == REMBRANCER_ADDRESS:
+            continue
+        for entry in entries:
+            # Skip non-balance series such as the issuer's total_issued entries
+            if 'balance' not in entry:
+                continue
+            snapshot = totals.setdefault(entry['timestamp'], {'total_balance': 0, 'holders': 0})
+            snapshot['total_balance'] += entry['balance']
+            if entry['balance'] > 0:
+                snapshot['holders'] += 1
+
+    return [
+        {'timestamp': timestamp, **totals[timestamp]}
+        for timestamp in sorted(totals)
+    ]
+
+def hashed_name(name, content):
+    """Insert a short content hash before the extension, e.g. leaderboard.3f2a9c1b0d4e.json"""
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return f"{stem}.{digest}{ext}"
+
+def write_file(output_dir, name, content):
+    """Write a file plus its precompressed .gz (and .br when brotli is installed) siblings."""
+    written = [name]
+    with open(os.path.join(output_dir, name), 'wb') as f:
+        f.write(content)
+
+    # mtime=0 keeps the gzip output stable so unchanged data produces no git diff
+    with open(os.path.join(output_dir, name + '.gz'), 'wb') as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    written.append(name + '.gz')
+
+    if brotli is not None:
+        with open(os.path.join(output_dir, name + '.br'), 'wb') as f:
+            f.write(brotli.compress(content))
+        written.append(name + '.br')
+
+    return written
+
+def export_site(output_dir=STATIC_DIR):
+    """Render the dashboard and its JSON data into a directory any static file server can host."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    balance_history = load_balance_history()
+    datasets = {
+        'leaderboard.json': build_leaderboard(load_data(), load_previous_balances()),
+        'history.json': balance_history,
+        'rollup.json': build_rollup(balance_history),
+        'stats.json': load_holder_stats()['history'],
+    }
+
+    written = []
+    manifest = {}
+    for name, data in datasets.items():
+        content = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        manifest[name] = hashed_name(name, content)
+        written += write_file(output_dir, manifest[name], content)
+
+    # manifest.json and index.html keep fixed names so they can be served with a short cache
+    # lifetime, while the hashed data files they point to can be cached forever.
+    written += write_file(output_dir, 'manifest.json', json.dumps(manifest, indent=2).encode('utf-8'))
+
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=True)
+    html = env.get_template('index.html').render(
+        balances_url=manifest['leaderboard.json'],
+        read_only=True
+    )
+    written += write_file(output_dir, 'index.html', html.encode('utf-8'))
+
+    # Drop hashed data files left over from previous exports
+    stale_prefixes = tuple(os.path.splitext(name)[0] + '.' for name in datasets)
+    for name in os.listdir(output_dir):
+        if name.startswith(stale_prefixes) and name not in written:
+            os.remove(os.path.join(output_dir, name))
+
+    print(f"Exported {len(written)} files to {output_dir}/")
+    return manifest
+
+def main():
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else STATIC_DIR
+    export_site(output_dir)
+
+if __name__ == "__main__":
+    main()
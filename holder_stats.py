@@ -0,0 +1,109 @@
+import json
+
+HOLDER_STATS_FILE = 'holder_stats.json'
+
+# Top-N holder counts reported as a share of total holdings
+TOP_N = (1, 5, 10)
+# Percentile bands reported over holder balances
+PERCENTILES = (25, 50, 75, 90)
+# Rank bands (by the previous snapshot's ranking) used for net flow, as (label, start, end)
+RANK_BANDS = (
+    ('top_5', 0, 5),
+    ('rank_6_10', 5, 10),
+    ('rest', 10, None),
+)
+
+def load_holder_stats():
+    try:
+        with open(HOLDER_STATS_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {
+            "last_snapshot": None,
+            "history": []
+        }
+
+def save_holder_stats(data):
+    with open(HOLDER_STATS_FILE, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def percentile(sorted_values, pct):
+    """Linearly interpolated percentile of an ascending list."""
+    if not sorted_values:
+        return 0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def compute_net_flow(balances, previous_balances):
+    """Net balance change per rank band, using the ranking from the previous snapshot."""
+    previous_ranking = sorted(previous_balances, key=lambda a: previous_balances[a], reverse=True)
+    flow = {}
+    for label, start, end in RANK_BANDS:
+        flow[label] = sum(
+            balances.get(address, 0) - previous_balances[address]
+            for address in previous_ranking[start:end]
+        )
+    # Holders that were not present in the previous snapshot
+    flow['new'] = sum(b for a, b in balances.items() if a not in previous_balances)
+    return flow
+
+def compute_snapshot_stats(balances, previous_balances=None):
+    """Distribution and concentration statistics for a single snapshot of {address: balance}."""
+    # Build the ascending balance array once; every statistic below reads from it
+    values = sorted(b for b in balances.values() if b > 0)
+
+    n = len(values)
+    total = sum(values)
+
+    if n == 0 or total == 0:
+        gini = 0
+        hhi = 0
+        top_shares = {str(k): 0 for k in TOP_N}
+    else:
+        # Gini from sorted values: (2 * sum(i * x_i)) / (n * total) - (n + 1) / n
+        weighted_sum = sum((i + 1) * x for i, x in enumerate(values))
+        gini = (2 * weighted_sum) / (n * total) - (n + 1) / n
+        # Herfindahl-Hirschman index on percentage shares (0-10,000)
+        hhi = sum((x / total * 100) ** 2 for x in values)
+        top_shares = {str(k): sum(values[-k:]) / total * 100 for k in TOP_N}
+
+    stats = {
+        'holders': n,
+        'total_balance': total,
+        'gini': gini,
+        'hhi': hhi,
+        'top_share': top_shares,
+        'percentiles': {f"p{p}": percentile(values, p) for p in PERCENTILES},
+        'net_flow': None,
+    }
+
+    if previous_balances:
+        stats['net_flow'] = compute_net_flow(balances, previous_balances)
+
+    return stats
+
+def record_snapshot(timestamp, balances):
+    """Compute stats for a new snapshot against the last recorded one and append them to the store.
+
+    Only the new snapshot is processed; earlier entries in the history are never recomputed.
+    """
+    data = load_holder_stats()
+    last_snapshot = data.get('last_snapshot')
+
+    if last_snapshot and last_snapshot['timestamp'] == timestamp:
+        # Already recorded, e.g. the script was re-run for the same snapshot
+        return data['history'][-1]
+
+    previous_balances = last_snapshot['balances'] if last_snapshot else None
+    stats = compute_snapshot_stats(balances, previous_balances)
+    stats['timestamp'] = timestamp
+
+    data['history'].append(stats)
+    data['last_snapshot'] = {
+        'timestamp': timestamp,
+        'balances': balances
+    }
+    save_holder_stats(data)
+    return stats
@@ -5,6 +5,7 @@ from datetime import datetime, timezone, timedelta
 from xrpl.clients import JsonRpcClient
 from xrpl.models.requests import AccountLines
 from pft_data import load_issuance_data
+from holder_stats import record_snapshot
 
 # Configure XRPL client
 JSON_RPC_URL = "https://s1.ripple.com:51234/"
@@ -196,6 +197,12 @@ def format_discord_message(balances, balance_history):
     # Calculate percentage relative to the recent period's issuance
     issuance_percentage = (change_in_total_held / period_issuance * 100) if period_issuance > 0 else 0
 
+    # Record distribution stats for this snapshot (same nerfed holder set as the leaderboard)
+    holder_stats = record_snapshot(
+        current_time.isoformat(),
+        {b['address']: b['balance'] for b in nerfed_balances if b['address'] != REMBRANCER_ADDRESS}
+    )
+
     # Create the message content
     message = f"🏆 **PFT Holdings Leaderboard - Post Nerf** - {current_time_str}\n\n"
 
@@ -213,6 +220,18 @@ def format_discord_message(balances, balance_history):
         message += f"📈 Percentage of New Issuance: {issuance_percentage:.1f}%\n"
 
     message += f"💰 Remembrancer PFT Balance: {remembrancer_balance:,.2f}\n"
+
+    # Add holder distribution stats
+    top_share = " / ".join(f"Top {n}: {share:.1f}%" for n, share in holder_stats['top_share'].items())
+    message += f"⚖️ **Gini**: {holder_stats['gini']:.3f} | **HHI**: {holder_stats['hhi']:,.0f} | {top_share}\n"
+    percentiles = " / ".join(f"{p.upper()}: {value:,.2f}" for p, value in holder_stats['percentiles'].items())
+    message += f"📏 Percentiles: {percentiles}\n"
+    if holder_stats['net_flow']:
+        flow = holder_stats['net_flow']
+        message += (
+            f"🔀 Net Flow: Top 5 {flow['top_5']:+,.2f} | Ranks 6-10 {flow['rank_6_10']:+,.2f}"
+            f" | Rest {flow['rest']:+,.2f} | New {flow['new']:+,.2f}\n"
+        )
     message += "\n"
 
     # Add all holders (no limit), excluding Remembrancer